@@ -79,7 +79,7 @@ class LinearPoroelasticMaterial(object):
         J2 = I2 * I3**(-2/3)
 
         f = 2*(J - 1 - ln(J))/(J-1)**2
-        if np.isnan(assemble(f*dx)):
+        if np.isnan(assemble(f*dx(metadata={'quadrature_degree': 4}))):
             f = 1.0
 
         Whyp = self.kappa1*(J1-3) + self.kappa2*(J2-3) + self.K*(J-1) - self.K*ln(J)
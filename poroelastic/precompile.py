@@ -0,0 +1,41 @@
+import dolfin as df
+
+from poroelastic.param_parser import ParamParser
+from poroelastic.problem import PoroelasticProblem
+
+
+def precompile(params, dims=(2, 3), tensor_cells=False):
+    """
+    Compile the forms of a PoroelasticProblem ahead of a simulation.
+
+    The generated code only depends on cell type, elements, material model
+    and number of compartments, so compiling on a single-cell mesh fills the
+    persistent form compiler cache for later runs on any mesh. Forms changed
+    after construction, e.g. by add_solid_neumann_conditions, have a
+    different signature and are still compiled on first use.
+
+    :param params: Parameter dictionary as returned by ParamParser.
+    :param dims: Spatial dimensions to compile for.
+    :param tensor_cells: Also compile for quadrilateral/hexahedral meshes.
+    """
+    meshes = []
+    for dim in dims:
+        if dim == 2:
+            meshes.append(df.UnitSquareMesh(1, 1))
+            if tensor_cells:
+                meshes.append(df.UnitSquareMesh.create(1, 1,
+                                        df.CellType.Type.quadrilateral))
+        else:
+            meshes.append(df.UnitCubeMesh(1, 1, 1))
+            if tensor_cells:
+                meshes.append(df.UnitCubeMesh.create(1, 1, 1,
+                                        df.CellType.Type.hexahedron))
+    for mesh in meshes:
+        pprob = PoroelasticProblem(mesh, params)
+        for form in pprob.forms():
+            df.Form(form, form_compiler_parameters=pprob._fc_params)
+
+
+if __name__ == "__main__":
+    params = ParamParser()
+    precompile(params.p)
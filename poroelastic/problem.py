@@ -1,22 +1,39 @@
 from dolfin import *
 from ufl import grad as ufl_grad
 import sys
-import numpy as np
+import os
 
 from poroelastic.material_models import *
 import poroelastic.utils as utils
 
 # Compiler parameters
 flags = ["-O3", "-ffast-math", "-march=native"]
-parameters["form_compiler"]["quadrature_degree"] = 4
 parameters["form_compiler"]["representation"] = "uflacs"
 parameters["form_compiler"]["cpp_optimize"] = True
 parameters["form_compiler"]["cpp_optimize_flags"] = " ".join(flags)
+parameters["form_compiler"]["optimize"] = True
+# Persistent JIT cache so repeated runs reuse compiled forms
+parameters["form_compiler"]["cache_dir"] = os.path.expanduser(
+                    os.environ.get("PORO_FFC_CACHE", "~/.cache/poro_ffc"))
 parameters["allow_extrapolation"] = True
 
 set_log_level(30)
 
 
+def tsfc_available():
+    """
+    TSFC representation is supported from DOLFIN 2017.2 if tsfc is installed
+    """
+    from distutils.version import LooseVersion
+    if LooseVersion(dolfin_version()) < LooseVersion("2017.2"):
+        return False
+    try:
+        import tsfc
+    except ImportError:
+        return False
+    return True
+
+
 class PoroelasticProblem(object):
     """
     Boundary marker labels:
@@ -35,6 +52,13 @@ class PoroelasticProblem(object):
         else:
             self.ds = ds()
 
+        # Quadrature degree per form. The fluid form is at most cubic in its
+        # P1 and P2 fields (grad(M).dU*vm), the rational inv(F) terms are
+        # truncated at the same order. The exponential solid strain energy is
+        # not integrated exactly at any order and keeps degree 4.
+        self.dxs = dx(metadata={'quadrature_degree': 4})
+        self.dxf = dx(metadata={'quadrature_degree': 3})
+
         if territories == None:
             self.territories = MeshFunction("size_t", mesh, mesh.topology().dim())
             self.territories.set_all(0)
@@ -54,25 +78,92 @@ class PoroelasticProblem(object):
         self.Us_n = Function(self.FS_S)
         self.mf = Function(self.FS_M)
         self.mf_n = Function(self.FS_M)
-        self.Uf = [Function(self.FS_V) for i in range(self.N)]
         if self.N == 1:
-            self.p = [Function(self.FS_M)]
+            self._m_total = variable(self.mf)
+        else:
+            self._m_total = variable(sum(self.mf[i] for i in range(self.N)))
+
+        # Compartment pressures and flow vectors are computed in one mixed
+        # Function each. The forms use the symbolic components, self.p and
+        # self.Uf are standalone copies refreshed once per time step.
+        self.p_mixed = Function(self.FS_M)
+        if self.N == 1:
+            self.FS_VM = self.FS_V
+            self.Uf_mixed = Function(self.FS_VM)
+            self._p_sym = [self.p_mixed]
+            self.p = [self.p_mixed]
+            self.Uf = [self.Uf_mixed]
         else:
-            self.p =\
-                [Function(self.FS_M.sub(0).collapse()) for i in range(self.N)]
+            VM = MixedElement([self.FS_V.ufl_element() for i in range(self.N)])
+            self.FS_VM = FunctionSpace(self.mesh, VM)
+            self.Uf_mixed = Function(self.FS_VM)
+            self._p_sym = split(self.p_mixed)
+            self.p = [Function(self.FS_F) for i in range(self.N)]
+            self.Uf = [Function(self.FS_V) for i in range(self.N)]
+            self._p_assigner = FunctionAssigner([self.FS_F]*self.N, self.FS_M)
+            self._Uf_assigner = FunctionAssigner([self.FS_V]*self.N, self.FS_VM)
+
+        # Kinematics shared by the solid and fluid forms
+        dU, L = split(self.Us)
+        d = dU.geometric_dimension()
+        self.I = Identity(d)
+        self.F = variable(self.I + ufl_grad(dU))
+        self.J = variable(det(self.F))
+        self.C = variable(self.F.T*self.F)
+        self.Finv = variable(inv(self.F))
+
+        # Isotropic permeability tensor
+        self._K_tensor = Constant(self.params['Parameter']['K'])*self.I
+
+        # Lumped-mass projection of the displacement onto P1 for move_mesh
+        v = TestFunction(self.FS_V)
+        self._MlV = inner(Constant((1.0,)*d), v)*dx
+        self._dU_proj = Function(self.FS_V)
+        self._b_proj = inner(dU, v)*dx
 
-        rho = self.rho()
-        phi0 = self.phi()
+        # Coefficients shared between the forms, built once so that form
+        # signatures stay stable; update them in place with assign
+        th, th_ = self.theta()
+        self._const = {'qi': self.q_in(), 'qo': self.q_out(),
+                        'beta': self.beta(), 'rho': self.rho(),
+                        'phi0': self.phi(), 'theta_th': th, 'theta_th_': th_,
+                        'k': Constant(1/self.dt())}
+        self.qi = self._const['qi']
+        rho = self._const['rho']
+        phi0 = self._const['phi0']
         if self.N == 1:
             self.phif = [variable(self.mf/rho + phi0)]
         else:
             self.phif = [variable(self.mf[i]/rho + phi0) for i in range(self.N)]
 
+        # Flow vector rhs and row-sum lumped mass for all compartments, the
+        # push-forward inv(F) is part of the rhs
+        if self.N == 1:
+            mv = [TestFunction(self.FS_VM)]
+        else:
+            mv = TestFunctions(self.FS_VM)
+        A = rho*self.J*self.Finv*self.K()*self.Finv.T
+        self._Uf_rhs = sum(inner(-A*grad(self._p_sym[i]), mv[i])
+                                                for i in range(self.N))*self.dxf
+        self._MlUf = sum(inner(Constant((1.0,)*d), mv[i])
+                                                for i in range(self.N))*dx
+
         self.sbcs = []
         self.fbcs = []
         self.pbcs = []
         self.tconditions = []
 
+        # Nonlinear solvers, built on first solve and reused across time steps
+        self._ssol = None
+        self._msol = None
+        self._newton_maxiter = 1000
+
+        # Factorised P1 pressure mass matrix, rebuilt when the mesh moves
+        self._p_solver = None
+
+        # Lumped Picard residual weights, rebuilt when the mesh moves
+        self._Ml_p1 = None
+
         # Material
         if self.params['Material']["material"] == "isotropic exponential form":
             self.material = IsotropicExponentialFormMaterial(self.params['Material'])
@@ -84,13 +175,25 @@ class PoroelasticProblem(object):
         # Set variational forms
         self.SForm, self.dSForm = self.set_solid_variational_form({})
         self.MForm, self.dMForm = self.set_fluid_variational_form()
+        self.set_pressure_forms()
 
 
     def create_function_spaces(self):
-        V1 = VectorElement('P', self.mesh.ufl_cell(), 1)
-        V2 = VectorElement('P', self.mesh.ufl_cell(), 2)
-        P1 = FiniteElement('P', self.mesh.ufl_cell(), 1)
-        P2 = FiniteElement('P', self.mesh.ufl_cell(), 2)
+        # Form compiler parameters of this problem, passed to every
+        # assembly so that the global defaults stay untouched
+        self._fc_params = {}
+        cell = self.mesh.ufl_cell()
+        if cell.cellname() in ['quadrilateral', 'hexahedron']:
+            # Tensor-product Lagrange allows sum factorisation with TSFC
+            family = 'Q'
+            if tsfc_available():
+                self._fc_params = {"representation": "tsfc",
+                                    "mode": "spectral"}
+        else:
+            family = 'P'
+        V1 = VectorElement(family, cell, 1)
+        V2 = VectorElement(family, cell, 2)
+        P1 = FiniteElement(family, cell, 1)
         TH = MixedElement([V2, P1]) # Taylor-Hood element
         FS_S = FunctionSpace(self.mesh, TH)
         if self.N == 1:
@@ -98,7 +201,7 @@ class PoroelasticProblem(object):
         else:
             M = MixedElement([P1 for i in range(self.N)])
             FS_M = FunctionSpace(self.mesh, M)
-        FS_F = FunctionSpace(self.mesh, P2)
+        FS_F = FunctionSpace(self.mesh, P1)
         FS_V = FunctionSpace(self.mesh, V1)
         return FS_S, FS_M, FS_F, FS_V
 
@@ -114,6 +217,7 @@ class PoroelasticProblem(object):
         else:
             self.sbcs.append(DirichletBC(self.FS_S.sub(0), condition,
                                 *args, **kwargs))
+        self._ssol = None
         if 'time' in kwargs.keys() and kwargs['time']:
             self.tconditions.append(condition)
 
@@ -121,6 +225,7 @@ class PoroelasticProblem(object):
     def add_solid_neumann_conditions(self, conditions, boundaries):
         self.SForm, self.dSForm =\
                     self.set_solid_variational_form(zip(conditions, boundaries))
+        self._ssol = None
 
 
     def add_fluid_dirichlet_condition(self, condition, *args, **kwargs):
@@ -134,6 +239,7 @@ class PoroelasticProblem(object):
             self.fbcs.append(DirichletBC(self.FS_M, condition, *args))
         else:
             self.fbcs.append(DirichletBC(self.FS_M.sub(sub), condition, *args))
+        self._msol = None
 
 
     def add_pressure_dirichlet_condition(self, condition, *args, **kwargs):
@@ -143,15 +249,16 @@ class PoroelasticProblem(object):
             sub = self.N-1
         if 'time' in kwargs.keys() and kwargs['time']:
             self.tconditions.append(condition)
-        self.pbcs.append(DirichletBC(self.FS_F, condition, *args))
+        if self.N == 1:
+            self.pbcs.append(DirichletBC(self.FS_M, condition, *args))
+        else:
+            self.pbcs += [DirichletBC(self.FS_M.sub(i), condition, *args)
+                                                    for i in range(self.N)]
+        self._p_solver = None
 
 
     def sum_fluid_mass(self):
-        if self.N == 1:
-            return self.mf/self.params['Parameter']['rho']
-        else:
-            return sum([self.mf[i]
-                    for i in range(self.N)])/self.params['Parameter']['rho']
+        return self._m_total/self.params['Parameter']['rho']
 
 
     def set_solid_variational_form(self, neumann_bcs):
@@ -162,23 +269,17 @@ class PoroelasticProblem(object):
         v, w = split(V)
 
         # parameters
-        rho = self.rho()
-        phi0 = Constant(self.params['Parameter']['phi'])
+        rho = self._const['rho']
+        phi0 = self._const['phi0']
 
         # fluid Solution
         m = self.sum_fluid_mass()
 
-        # Kinematics
         n = FacetNormal(self.mesh)
-        d = dU.geometric_dimension()
-        self.I = Identity(d)
-        self.F = variable(self.I + ufl_grad(dU))
-        self.J = variable(det(self.F))
-        self.C = variable(self.F.T*self.F)
 
         self.Psi = self.material.constitutive_law(J=self.J, C=self.C,
                                                 M=m, rho=rho, phi=phi0)
-        Psic = self.Psi*dx + L*(self.J-Constant(1)-m/rho)*dx
+        Psic = self.Psi*self.dxs + L*(self.J-Constant(1)-m/rho)*self.dxs
 
         for condition, boundary in neumann_bcs:
             Psic += dot(condition*n, dU)*self.ds(boundary)
@@ -193,18 +294,16 @@ class PoroelasticProblem(object):
 
         m = self.mf
         m_n = self.mf_n
-        dU, L = self.Us.split(True)
-        dU_n, L_n = self.Us_n.split(True)
+        dU, L = split(self.Us)
+        dU_n, L_n = split(self.Us_n)
 
         # Parameters
-        self.qi = self.q_in()
-        q_out = self.q_out()
-        rho = self.rho()
-        beta = self.beta()
-        k = Constant(1/self.dt())
-        dt = Constant(self.dt())
-        th, th_ = self.theta()
-        n = FacetNormal(self.mesh)
+        q_out = self._const['qo']
+        rho = self._const['rho']
+        beta = self._const['beta']
+        k = self._const['k']
+        th = self._const['theta_th']
+        th_ = self._const['theta_th_']
 
         # VK = TensorFunctionSpace(self.mesh, "P", 1)
         # if d == 2:
@@ -218,87 +317,143 @@ class PoroelasticProblem(object):
         M = th*m + th_*m_n
 
         # Fluid variational form
-        A = variable(rho * self.J * inv(self.F) * self.K() * inv(self.F.T))
+        A = variable(rho * self.J * self.Finv * self.K() * self.Finv.T)
         if self.N == 1:
             vm = TestFunction(self.FS_M)
-            Form = k*(m - m_n)*vm*dx + dot(grad(M), k*(dU-dU_n))*vm*dx +\
-                    inner(-A*grad(self.p[0]), grad(vm))*dx
+            Form = k*(m - m_n)*vm*self.dxf +\
+                    dot(grad(M), k*(dU-dU_n))*vm*self.dxf +\
+                    inner(-A*grad(self._p_sym[0]), grad(vm))*self.dxf
 
             # Add inflow terms
-            Form += -rho*self.qi*vm*dx
+            Form += -rho*self.qi*vm*self.dxf
 
             # Add outflow term
-            Form += rho*q_out*vm*dx
+            Form += rho*q_out*vm*self.dxf
 
         else:
             vm = TestFunctions(self.FS_M)
-            Form = sum([k*(m[i] - m_n[i])*vm[i]*dx for i in range(self.N)])\
-                + sum([dot(grad(M[i]), k*(dU-dU_n))*vm[i]*dx
-                                                    for i in range(self.N)])\
-                + sum([inner(-A*grad(self.p[i]), grad(vm[i]))*dx
-                                                    for i in range(self.N)])
+            # All compartments in a single integrand
+            integrand = sum(k*(m[i] - m_n[i])*vm[i]
+                            + dot(grad(M[i]), k*(dU-dU_n))*vm[i]
+                            + inner(-A*grad(self._p_sym[i]), grad(vm[i]))
+                                                    for i in range(self.N))
 
             # Compartment exchange
-            for i in range(len(beta)):
-                Form += -self.J*beta[i]*((self.p[i] - self.p[i+1])*vm[i] +\
-                                        (self.p[i+1] - self.p[i])*vm[i+1])*dx
+            p = self._p_sym
+            integrand += sum(-self.J*beta[i]*((p[i] - p[i+1])*vm[i] +\
+                                        (p[i+1] - p[i])*vm[i+1])
+                                                    for i in range(len(beta)))
 
-            # Add inflow terms
-            Form += -rho*self.qi*vm[0]*dx
-
-            # Add outflow term
-            Form += rho*q_out*vm[-1]*dx
+            # Add inflow and outflow terms
+            Form = integrand*self.dxf - rho*self.qi*vm[0]*self.dxf +\
+                    rho*q_out*vm[-1]*self.dxf
 
         dF = derivative(Form, m, TrialFunction(self.FS_M))
 
         return Form, dF
 
 
-    def fluid_solid_coupling(self):
-        dU, L = self.Us.split(True)
-        p = TrialFunction(self.FS_F)
-        q = TestFunction(self.FS_F)
+    def set_pressure_forms(self):
+        dU, L = split(self.Us)
         if self.N == 1:
-            FS = self.FS_M
+            p = [TrialFunction(self.FS_M)]
+            q = [TestFunction(self.FS_M)]
         else:
-            FS = self.FS_M.sub(0).collapse()
-        for i in range(self.N):
-            a = p*q*dx
-            Ll = (tr(diff(self.Psi, self.F) * self.F.T))/self.phif[i]*q*dx - L*q*dx
-            p = Function(self.FS_F)
-            solve(a == Ll, p, self.pbcs, solver_parameters={"linear_solver": "minres",
-                                                "preconditioner": "hypre_amg"})
-            self.p[i].assign(project(p, FS))
+            p = TrialFunctions(self.FS_M)
+            q = TestFunctions(self.FS_M)
 
+        # Pressure recovery from the solid stress for all compartments in one
+        # block-diagonal system, see fluid_solid_coupling
+        self._M_p = sum(p[i]*q[i] for i in range(self.N))*dx
+        self._p_rhs = sum((tr(diff(self.Psi, self.F) * self.F.T))/self.phif[i]
+                        *q[i] - L*q[i] for i in range(self.N))*self.dxs
 
-    def calculate_flow_vector(self):
-        FS = VectorFunctionSpace(self.mesh, 'P', 1)
-        dU, L = self.Us.split(True)
-        m = TrialFunction(self.FS_V)
-        mv = TestFunction(self.FS_V)
+        # Lumped mass of the first compartment pressure for the Picard
+        # residual, zero on the other compartments
+        self._Ml_p0 = TestFunctions(self.FS_M)[0]*dx
 
-        # Parameters
-        rho = Constant(self.rho())
 
-        for i in range(self.N):
-            a = (1/rho)*inner(self.F*m, mv)*dx
-            L = inner(-self.J*self.K()*inv(self.F.T)*grad(self.p[i]), mv)*dx
+    def forms(self):
+        """
+        Return all forms assembled during solve()
+        """
+        return [self.SForm, self.dSForm, self.MForm, self.dMForm, self._M_p,
+                self._Ml_p0, self._p_rhs, self._Uf_rhs, self._MlUf,
+                self._MlV, self._b_proj]
 
-            solve(a == L, self.Uf[i], solver_parameters={"linear_solver": "minres",
-                                                "preconditioner": "hypre_amg"})
 
+    def fluid_solid_coupling(self):
+        if self._p_solver is None:
+            M = assemble(self._M_p, form_compiler_parameters=self._fc_params)
+            for bc in self.pbcs:
+                bc.apply(M)
+            self._p_solver = LUSolver(M)
+            self._p_solver.parameters['reuse_factorization'] = True
+        b = assemble(self._p_rhs, form_compiler_parameters=self._fc_params)
+        for bc in self.pbcs:
+            bc.apply(b)
+        self._p_solver.solve(self.p_mixed.vector(), b)
+
+
+    def calculate_flow_vector(self):
+        # Lumped mass solve for all compartments at once
+        Ml = assemble(self._MlUf,
+                        form_compiler_parameters=self._fc_params).get_local()
+        b = assemble(self._Uf_rhs, form_compiler_parameters=self._fc_params)
+        self.Uf_mixed.vector().set_local(b.get_local()/Ml)
+        self.Uf_mixed.vector().apply('insert')
 
 
     def move_mesh(self):
-        dU, L = self.Us.split(True)
-        ALE.move(self.mesh, project(dU, VectorFunctionSpace(self.mesh, 'P', 1)))
+        # Row-sum lumped mass is reassembled as a vector since the mesh moves
+        Ml = assemble(self._MlV, form_compiler_parameters=self._fc_params)
+        b = assemble(self._b_proj, form_compiler_parameters=self._fc_params)
+        self._dU_proj.vector().set_local(b.get_local()/Ml.get_local())
+        self._dU_proj.vector().apply('insert')
+        ALE.move(self.mesh, self._dU_proj)
+        self._p_solver = None
+        self._Ml_p1 = None
 
 
-    def choose_solver(self, prob):
+    def choose_solver(self, prob, **kwargs):
         if self.params['Simulation']['solver'] == 'direct':
             return self.direct_solver(prob)
         else:
-            return self.iterative_solver(prob)
+            return self.iterative_solver(prob, **kwargs)
+
+
+    def create_solvers(self):
+        if self._msol is None:
+            mprob = NonlinearVariationalProblem(self.MForm, self.mf,
+                                            bcs=self.fbcs, J=self.dMForm,
+                                form_compiler_parameters=self._fc_params)
+            if self.N > 1:
+                # Exchange terms make the multi-compartment Jacobian nonsymmetric
+                self._msol = self.choose_solver(mprob, linear_solver='gmres')
+            else:
+                self._msol = self.choose_solver(mprob)
+
+        if self._ssol is None:
+            sprob = NonlinearVariationalProblem(self.SForm, self.Us,
+                                            bcs=self.sbcs, J=self.dSForm,
+                                form_compiler_parameters=self._fc_params)
+            self._ssol = self.choose_solver(sprob, linear_solver='gmres')
+
+        return self._ssol, self._msol
+
+
+    def solve_solid(self, ssol):
+        # BoomerAMG strength threshold suited to 3D elasticity. PETSc options
+        # are global, so it is only set for the duration of the solid solve.
+        amg = self.params['Simulation']['solver'] != 'direct' and\
+                self.mesh.geometry().dim() == 3
+        if amg:
+            PETScOptions.set("pc_hypre_boomeramg_strong_threshold", 0.7)
+        try:
+            ssol.solve()
+        finally:
+            if amg:
+                PETScOptions.clear("pc_hypre_boomeramg_strong_threshold")
 
 
     def solve(self):
@@ -310,13 +465,13 @@ class PoroelasticProblem(object):
         t = 0.0
         dt = self.dt()
 
-        mprob = NonlinearVariationalProblem(self.MForm, self.mf, bcs=self.fbcs,
-                                            J=self.dMForm)
-        msol = self.choose_solver(mprob)
+        ssol, msol = self.create_solvers()
 
-        sprob = NonlinearVariationalProblem(self.SForm, self.Us, bcs=self.sbcs,
-                                            J=self.dSForm)
-        ssol = self.choose_solver(sprob)
+        # Lagged solid Jacobian, refactorised every refactor_period iterations
+        snewton = ssol.parameters['newton_solver']
+        refactor_period = int(self.params['Simulation'].get('refactor_period', 5))
+        if refactor_period < 1:
+            raise ValueError("refactor_period must be at least 1")
 
         while t < self.params['Parameter']['tf']:
 
@@ -325,17 +480,38 @@ class PoroelasticProblem(object):
             for con in self.tconditions:
                 con.t = t
 
+            if self._Ml_p1 is None:
+                self._Ml_p1 =\
+                    assemble(self._Ml_p0,
+                        form_compiler_parameters=self._fc_params).get_local()
+
             iter = 0
             eps = 1
-            mf_ = Function(self.FS_F)
-            while eps > tol and iter < maxiter:
-                mf_.assign(self.p[0])
-                ssol.solve()
-                self.fluid_solid_coupling()
-                msol.solve()
-                e = self.p[0] - mf_
-                eps = np.sqrt(assemble(e**2*dx))
-                iter += 1
+            try:
+                while eps > tol and iter < maxiter:
+                    mf_ = self.p_mixed.vector().get_local()
+                    # Quasi-Newton: full Newton solve with a fresh
+                    # factorisation on the first Picard iteration, single
+                    # lagged Newton steps afterwards
+                    if iter == 0:
+                        snewton['maximum_iterations'] = self._newton_maxiter
+                        snewton['error_on_nonconvergence'] = True
+                    else:
+                        snewton['maximum_iterations'] = 1
+                        snewton['error_on_nonconvergence'] = False
+                    if self.params['Simulation']['solver'] == 'direct':
+                        snewton['lu_solver']['reuse_factorization'] =\
+                                iter % refactor_period != 0
+                    self.solve_solid(ssol)
+                    self.fluid_solid_coupling()
+                    msol.solve()
+                    eps = utils.weighted_norm(self.p_mixed.vector().get_local(),
+                                                mf_, self._Ml_p1, comm)
+                    iter += 1
+            finally:
+                # Restore full Newton for the next time step or solve() call
+                snewton['maximum_iterations'] = self._newton_maxiter
+                snewton['error_on_nonconvergence'] = True
 
             # Store current solution as previous
             self.mf_n.assign(self.mf)
@@ -344,6 +520,11 @@ class PoroelasticProblem(object):
             # Calculate fluid vector
             self.calculate_flow_vector()
 
+            # Refresh the standalone compartment Functions
+            if self.N > 1:
+                self._p_assigner.assign(self.p, self.p_mixed)
+                self._Uf_assigner.assign(self.Uf, self.Uf_mixed)
+
             yield self.mf, self.Uf, self.p, self.Us, t
 
             self.move_mesh()
@@ -358,18 +539,20 @@ class PoroelasticProblem(object):
         sol = NonlinearVariationalSolver(prob)
         sol.parameters['newton_solver']['linear_solver'] = 'mumps'
         sol.parameters['newton_solver']['lu_solver']['reuse_factorization'] = True
-        sol.parameters['newton_solver']['maximum_iterations'] = 1000
+        sol.parameters['newton_solver']['maximum_iterations'] = self._newton_maxiter
         return sol
 
 
-    def iterative_solver(self, prob):
+    def iterative_solver(self, prob, linear_solver='minres'):
         TOL = self.TOL()
         sol = NonlinearVariationalSolver(prob)
-        sol.parameters['newton_solver']['linear_solver'] = 'minres'
+        sol.parameters['newton_solver']['linear_solver'] = linear_solver
         sol.parameters['newton_solver']['preconditioner'] = 'hypre_amg'
         sol.parameters['newton_solver']['absolute_tolerance'] = TOL
         sol.parameters['newton_solver']['relative_tolerance'] = TOL
-        sol.parameters['newton_solver']['maximum_iterations'] = 1000
+        sol.parameters['newton_solver']['maximum_iterations'] = self._newton_maxiter
+        sol.parameters['newton_solver']['krylov_solver']['nonzero_initial_guess'] = True
+        sol.parameters['newton_solver']['krylov_solver']['monitor_convergence'] = False
         return sol
 
 
@@ -415,22 +598,7 @@ class PoroelasticProblem(object):
             return Constant(self.params['Parameter']['qi'])
 
     def K(self):
-        # if self.N == 1:
-        d = self.mf.geometric_dimension()
-        I = Identity(d)
-        K = Constant(self.params['Parameter']['K'])
-        if self.fibers:
-            return K*I
-        else:
-            return K*I
-        # else:
-        #     d = self.u[0].geometric_dimension()
-        #     I = Identity(d)
-        #     K = [Constant(k) for k in self.params.params['K']]
-        #     if self.fiber:
-        #         return [k*self.fiber*I for k in K]
-        #     else:
-        #         return [k*I for k in K]
+        return self._K_tensor
 
     def dt(self):
         return self.params['Parameter']['dt']
@@ -3,6 +3,7 @@ __author__ = "Alexandra Diem <alexandra@simula.no>"
 from scipy.interpolate import interp1d
 from itertools import chain
 import sys
+import numpy as np
 
 import dolfin as df
 
@@ -49,6 +50,15 @@ def print_time(t):
     sys.stdout.flush()
 
 
+def weighted_norm(x, y, w, comm):
+    """
+    Weighted l2 norm sqrt(sum(w*(x-y)**2)) of two local dof arrays, summed
+    over all processes in comm
+    """
+    d = x - y
+    return np.sqrt(df.MPI.sum(comm, np.dot(w, d*d)))
+
+
 def periodic(t, T):
     while t > T:
         t -= T